@@ -2,24 +2,65 @@
 Flask Application Factory
 """
 from flask import Flask
+from flask_compress import Compress
 from flask_cors import CORS
 from flask_jwt_extended import JWTManager
 from dotenv import load_dotenv
+from logging.handlers import QueueHandler, QueueListener
+import atexit
+import logging
 import os
+import queue
 
 # Load environment variables
 load_dotenv()
 
 # Initialize extensions
 jwt = JWTManager()
+compress = Compress()
+_log_listener = None
+
+def configure_logging():
+    """
+    Send log records through a queue so handler work (stream writes and
+    flushes) happens on a background listener thread. QueueHandler still
+    formats the message and any traceback on the calling thread.
+    """
+    global _log_listener
+    
+    if _log_listener is not None:
+        return
+    
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter('%(asctime)s [%(levelname)s] %(name)s: %(message)s')
+    )
+    
+    root = logging.getLogger()
+    root.setLevel(os.getenv('LOG_LEVEL', 'INFO').upper())
+    root.handlers = [QueueHandler(log_queue)]
+    
+    _log_listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
 
 def create_app():
     """Create and configure the Flask application."""
+    configure_logging()
     app = Flask(__name__)
     
+    # Serialize JSON with orjson
+    from app.utils.json_provider import ORJSONProvider
+    app.json = ORJSONProvider(app)
+    
     # Load configuration
     app.config.from_object('app.config.Config')
     
+    # Flask drops the 'app' logger to DEBUG in debug mode; module loggers
+    # (app.routes.video, ...) are its children, so keep it at LOG_LEVEL
+    app.logger.setLevel(logging.getLogger().level)
+    
     # Initialize CORS - allow ngrok header for remote testing
     CORS(app, resources={
         r"/*": {
@@ -32,10 +73,17 @@ def create_app():
     # Initialize JWT
     jwt.init_app(app)
     
+    # Compress JSON responses above COMPRESS_MIN_SIZE
+    compress.init_app(app)
+    
     # Initialize MongoDB
     from app.database import init_db
     init_db(app)
     
+    # Initialize optional Redis cache
+    from app.cache import init_cache
+    init_cache(app)
+    
     # Register blueprints
     from app.routes.auth import auth_bp
     from app.routes.video import video_bp
@@ -48,6 +96,19 @@ def create_app():
     def health_check():
         return {'status': 'healthy', 'message': 'API is running'}, 200
     
+    # Prometheus metrics route
+    @app.route('/metrics')
+    def metrics():
+        from app.models.user import get_hash_metrics
+        stats = get_hash_metrics()
+        body = (
+            "# TYPE password_hash_queue_length gauge\n"
+            f"password_hash_queue_length {stats['queue_length']}\n"
+            "# TYPE password_hash_processing_ms_total counter\n"
+            f"password_hash_processing_ms_total {stats['processing_ms']:.3f}\n"
+        )
+        return app.response_class(body, mimetype='text/plain; version=0.0.4')
+    
     # JWT error handlers
     @jwt.expired_token_loader
     def expired_token_callback(jwt_header, jwt_payload):
@@ -61,5 +122,5 @@ def create_app():
     def missing_token_callback(error):
         return {'error': 'Authorization required', 'message': 'No token provided'}, 401
     
-    print("[OK] Flask app initialized successfully")
+    app.logger.info("Flask app initialized successfully")
     return app
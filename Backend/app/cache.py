@@ -0,0 +1,34 @@
+"""
+Redis Connection (optional shared cache)
+"""
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Global client instance (stays None when REDIS_URL is not configured)
+client = None
+
+def init_cache(app):
+    """Initialize the Redis client if REDIS_URL is configured."""
+    global client
+
+    redis_url = app.config.get('REDIS_URL')
+    if not redis_url:
+        logger.info("REDIS_URL not set, using per-process cache only")
+        return
+
+    import redis
+
+    # Short timeouts: the cache is an optimization and must never stall requests
+    client = redis.Redis.from_url(
+        redis_url,
+        decode_responses=False,
+        socket_timeout=0.5,
+        socket_connect_timeout=0.5
+    )
+    logger.info("Redis cache configured")
+
+def get_redis():
+    """Get the Redis client (None if not configured)."""
+    global client
+    return client
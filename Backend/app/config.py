@@ -13,14 +13,37 @@ class Config:
     
     # MongoDB
     MONGO_URI = os.getenv('MONGO_URI', 'mongodb://localhost:27017/video_app')
+    MONGO_MAX_POOL = int(os.getenv('MONGO_MAX_POOL', 200))
+    MONGO_MIN_POOL = int(os.getenv('MONGO_MIN_POOL', 10))
+    MONGO_MAX_CONNECTING = int(os.getenv('MONGO_MAX_CONNECTING', 8))
+    MONGO_MAX_IDLE_TIME_MS = 60000
+    MONGO_SERVER_SELECTION_TIMEOUT_MS = 3000
+    MONGO_SOCKET_TIMEOUT_MS = 10000
+    MONGO_CONNECT_TIMEOUT_MS = 5000
+    
+    # Redis (optional, shares the stream URL cache across workers)
+    REDIS_URL = os.getenv('REDIS_URL')
     
     # JWT Configuration
-    JWT_SECRET_KEY = os.getenv('JWT_SECRET_KEY', 'jwt-secret-key-change-in-production')
+    # Stored as bytes so PyJWT doesn't re-encode the key on every token
+    JWT_SECRET_KEY = os.getenv('JWT_SECRET_KEY', 'jwt-secret-key-change-in-production').encode('utf-8')
+    JWT_ALGORITHM = 'HS256'
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(seconds=int(os.getenv('JWT_ACCESS_TOKEN_EXPIRES', 86400)))
     JWT_TOKEN_LOCATION = ['headers']
     JWT_HEADER_NAME = 'Authorization'
     JWT_HEADER_TYPE = 'Bearer'
     
+    # Password hashing: Argon2id (legacy bcrypt hashes are upgraded on next login)
+    ARGON2_TIME_COST = int(os.getenv('ARGON2_TIME_COST', 2))
+    ARGON2_MEMORY_COST = int(os.getenv('ARGON2_MEMORY_COST', 64 * 1024))  # KiB
+    ARGON2_PARALLELISM = int(os.getenv('ARGON2_PARALLELISM', 2))
+    
+    # Response compression (flask-compress)
+    COMPRESS_MIMETYPES = ['application/json', 'text/html']
+    COMPRESS_LEVEL = 6  # gzip
+    COMPRESS_MIN_SIZE = 500
+    COMPRESS_ALGORITHM = ['br', 'gzip']
+    
     # Video Configuration
     VIDEO_TOKEN_EXPIRES = 3600  # 1 hour for video playback tokens
 
@@ -1,11 +1,15 @@
 """
 MongoDB Database Connection
 """
+from bson.codec_options import CodecOptions
 from pymongo import MongoClient
 from pymongo.errors import ConnectionFailure
 from urllib.parse import urlparse
+import logging
 import os
 
+logger = logging.getLogger(__name__)
+
 # Global database instance
 db = None
 client = None
@@ -30,23 +34,49 @@ def init_db(app):
     mongo_uri = app.config.get('MONGO_URI')
     
     try:
-        client = MongoClient(mongo_uri)
-        # Test connection
+        # Explicit pool sizing and timeouts so login bursts don't queue
+        # behind the default 2-at-a-time connect limit, and a dead server
+        # fails fast instead of blocking workers indefinitely
+        client = MongoClient(
+            mongo_uri,
+            maxPoolSize=app.config.get('MONGO_MAX_POOL', 200),
+            minPoolSize=app.config.get('MONGO_MIN_POOL', 10),
+            maxConnecting=app.config.get('MONGO_MAX_CONNECTING', 8),
+            maxIdleTimeMS=app.config.get('MONGO_MAX_IDLE_TIME_MS', 60000),
+            serverSelectionTimeoutMS=app.config.get('MONGO_SERVER_SELECTION_TIMEOUT_MS', 3000),
+            socketTimeoutMS=app.config.get('MONGO_SOCKET_TIMEOUT_MS', 10000),
+            connectTimeoutMS=app.config.get('MONGO_CONNECT_TIMEOUT_MS', 5000),
+            retryWrites=True,
+            w='majority',
+            appname='veilplay'
+        )
+        # Test connection (also warms the pool before the first request)
         client.admin.command('ping')
         
         # Get database name from URI or use default
         db_name = get_database_name(mongo_uri)
-        db = client[db_name]
+        db = client.get_database(db_name, codec_options=CodecOptions(tz_aware=False))
+        
+        logger.info("Connected to MongoDB: %s", db_name)
         
-        print(f"[OK] Connected to MongoDB: {db_name}")
+        # Bind model collection handles once
+        register_collections(db)
         
         # Create indexes
         create_indexes()
         
     except ConnectionFailure as e:
-        print(f"[ERROR] MongoDB connection failed: {e}")
+        logger.error("MongoDB connection failed: %s", e)
         raise e
 
+def register_collections(database):
+    """Publish collection handles on the models so they skip per-call lookups."""
+    from app.models.user import User
+    from app.models.video import Video
+    
+    for model in (User, Video):
+        model.collection = database[model.collection_name]
+
 def create_indexes():
     """Create database indexes for better performance."""
     global db
@@ -55,10 +85,19 @@ def create_indexes():
         # User indexes
         db.users.create_index('email', unique=True)
         
-        # Video indexes
-        db.videos.create_index('is_active')
+        # Video indexes: partial index serving the active-videos dashboard
+        # query (a single-field index on a boolean is near-useless)
+        db.videos.create_index(
+            [('created_at', -1)],
+            partialFilterExpression={'is_active': True},
+            name='active_recent'
+        )
+        if 'is_active_1' in db.videos.index_information():
+            db.videos.drop_index('is_active_1')
+        # Seeding upserts by youtube_id; keep that lookup indexed and unique
+        db.videos.create_index('youtube_id', unique=True)
         
-        print("[OK] Database indexes created")
+        logger.info("Database indexes created")
 
 def get_db():
     """Get the database instance."""
@@ -1,34 +1,176 @@
 """
 User Model
 """
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from datetime import datetime
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 from bson import ObjectId
+from cachetools import TTLCache
+from pymongo import WriteConcern
 import bcrypt
-from app.database import get_db
+import os
+import threading
+import time
+from flask import current_app
+from app.config import Config
+
+
+# bcrypt and argon2 release the GIL while hashing, so a small thread pool
+# keeps the CPU-bound work off the request thread without pickling overhead.
+# Each Argon2id job uses ARGON2_PARALLELISM threads and ARGON2_MEMORY_COST
+# of memory, so by default the pool only runs as many jobs as the CPUs fit
+_HASH_POOL = ThreadPoolExecutor(
+    max_workers=int(os.getenv(
+        'PASSWORD_HASH_WORKERS',
+        max(1, (os.cpu_count() or 1) // Config.ARGON2_PARALLELISM)
+    )),
+    thread_name_prefix='password-hash'
+)
+# Backpressure: reject new work instead of queueing without bound
+_HASH_SLOTS = threading.BoundedSemaphore(int(os.getenv('PASSWORD_HASH_MAX_QUEUE', 500)))
+HASH_TIMEOUT = 10  # seconds
+
+_hash_stats = {'queue_length': 0, 'processing_ms': 0.0}
+_hash_stats_lock = threading.Lock()
+
+
+# Short-lived cache of user documents by id, mostly serving /auth/me.
+# TTL is kept short since other workers can't see invalidations.
+_user_cache = TTLCache(maxsize=10000, ttl=30)
+_user_cache_lock = threading.Lock()
+
+
+class HashQueueFull(Exception):
+    """Raised when too many password hashing jobs are already pending."""
+
+
+_argon2_hashers = {}
+
+
+def _run_hasher(func, *args):
+    """
+    Run a password hashing call on the worker pool, enforcing the queue bound.
+    
+    The queue slot is released when the job actually finishes (or is
+    cancelled), not when the caller stops waiting, so timed-out work still
+    counts against the bound. A timeout is reported as HashQueueFull so
+    clients back off with a 503.
+    """
+    if not _HASH_SLOTS.acquire(blocking=False):
+        raise HashQueueFull()
+    
+    with _hash_stats_lock:
+        _hash_stats['queue_length'] += 1
+    start = time.perf_counter()
+    
+    def _on_done(_future):
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        with _hash_stats_lock:
+            _hash_stats['queue_length'] -= 1
+            _hash_stats['processing_ms'] += elapsed_ms
+        _HASH_SLOTS.release()
+    
+    try:
+        future = _HASH_POOL.submit(func, *args)
+    except Exception:
+        _on_done(None)
+        raise
+    future.add_done_callback(_on_done)
+    
+    try:
+        return future.result(timeout=HASH_TIMEOUT)
+    except FutureTimeoutError:
+        # Drop the job if it hasn't started; a running job keeps its slot
+        future.cancel()
+        raise HashQueueFull()
+
+
+def _argon2_hasher() -> PasswordHasher:
+    """Get a PasswordHasher for the configured Argon2id parameters."""
+    config = current_app.config
+    params = (
+        config.get('ARGON2_TIME_COST', 2),
+        config.get('ARGON2_MEMORY_COST', 64 * 1024),
+        config.get('ARGON2_PARALLELISM', 2)
+    )
+    hasher = _argon2_hashers.get(params)
+    if hasher is None:
+        hasher = _argon2_hashers[params] = PasswordHasher(*params)
+    return hasher
+
+
+def _argon2_verify(hasher: PasswordHasher, password: str, password_hash: str) -> bool:
+    """Verify an Argon2 hash, mapping mismatches to False."""
+    try:
+        return hasher.verify(password_hash, password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+
+def get_hash_metrics() -> dict:
+    """Snapshot of password hashing pool metrics."""
+    with _hash_stats_lock:
+        return dict(_hash_stats)
 
 
 class User:
     """User model for authentication and profile management."""
     
     collection_name = 'users'
+    collection = None  # Bound by database.register_collections
+    # Fields needed to rebuild a User; avoids decoding anything else
+    projection = {'name': 1, 'email': 1, 'password_hash': 1, 'created_at': 1}
     
     def __init__(self, name, email, password_hash=None, _id=None, created_at=None):
         self._id = _id or ObjectId()
         self.name = name
-        self.email = email.lower()
+        self.email = email if email.islower() else email.lower()
         self.password_hash = password_hash
         self.created_at = created_at or datetime.utcnow()
+        self._json_cache = None
     
     @staticmethod
     def hash_password(password: str) -> str:
-        """Hash a password using bcrypt."""
-        salt = bcrypt.gensalt()
-        return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
+        """Hash a password using Argon2id at the configured cost."""
+        return _run_hasher(_argon2_hasher().hash, password)
     
     @staticmethod
     def verify_password(password: str, password_hash: str) -> bool:
-        """Verify a password against its hash."""
-        return bcrypt.checkpw(password.encode('utf-8'), password_hash.encode('utf-8'))
+        """Verify a password against its hash (Argon2id or legacy bcrypt)."""
+        if password_hash.startswith('$argon2'):
+            return _run_hasher(_argon2_verify, _argon2_hasher(), password, password_hash)
+        return _run_hasher(
+            bcrypt.checkpw,
+            password.encode('utf-8'),
+            password_hash.encode('utf-8')
+        )
+    
+    @staticmethod
+    def needs_rehash(password_hash: str) -> bool:
+        """Check whether a stored hash is legacy bcrypt or uses outdated Argon2 parameters."""
+        if not password_hash.startswith('$argon2'):
+            return True
+        return _argon2_hasher().check_needs_rehash(password_hash)
+    
+    def update_password_hash(self, password_hash: str) -> 'User':
+        """
+        Persist a new password hash without rewriting the whole document.
+        Uses w=1: the old hash stays valid, so losing this write is harmless.
+        """
+        self.password_hash = password_hash
+        self.collection.with_options(write_concern=WriteConcern(w=1)).update_one(
+            {'_id': self._id},
+            {'$set': {'password_hash': password_hash}}
+        )
+        self._invalidate_cache()
+        return self
+    
+    def _invalidate_cache(self):
+        """Drop this user's memoized JSON and find_by_id cache entry."""
+        self._json_cache = None
+        with _user_cache_lock:
+            _user_cache.pop(str(self._id), None)
     
     def to_dict(self) -> dict:
         """Convert user to dictionary."""
@@ -41,29 +183,41 @@ class User:
         }
     
     def to_json(self) -> dict:
-        """Convert user to JSON-safe dictionary (without password)."""
-        return {
-            'id': str(self._id),
-            'name': self.name,
-            'email': self.email,
-            'created_at': self.created_at.isoformat() if self.created_at else None
-        }
+        """
+        Convert user to a JSON-serializable dictionary (without password).
+        Memoized until the next save(); treat the result as read-only.
+        """
+        if self._json_cache is None:
+            self._json_cache = {
+                'id': str(self._id),
+                'name': self.name,
+                'email': self.email,
+                'created_at': self.created_at  # Serialized to ISO-8601 by orjson
+            }
+        return self._json_cache
     
     def save(self) -> 'User':
         """Save user to database."""
-        db = get_db()
-        db[self.collection_name].update_one(
+        self.collection.update_one(
             {'_id': self._id},
             {'$set': self.to_dict()},
             upsert=True
         )
+        self._invalidate_cache()
+        return self
+    
+    def insert(self) -> 'User':
+        """Insert a new user into the database."""
+        self.collection.insert_one(self.to_dict())
         return self
     
     @classmethod
     def find_by_email(cls, email: str) -> 'User':
         """Find user by email."""
-        db = get_db()
-        data = db[cls.collection_name].find_one({'email': email.lower()})
+        data = cls.collection.find_one(
+            {'email': email if email.islower() else email.lower()},
+            projection=cls.projection
+        )
         if data:
             return cls(
                 name=data['name'],
@@ -76,26 +230,33 @@ class User:
     
     @classmethod
     def find_by_id(cls, user_id: str) -> 'User':
-        """Find user by ID."""
-        db = get_db()
-        try:
-            data = db[cls.collection_name].find_one({'_id': ObjectId(user_id)})
-            if data:
-                return cls(
-                    name=data['name'],
-                    email=data['email'],
-                    password_hash=data['password_hash'],
-                    _id=data['_id'],
-                    created_at=data.get('created_at')
-                )
-        except Exception:
-            pass
-        return None
+        """Find user by ID (served from a short TTL cache when possible)."""
+        if not ObjectId.is_valid(user_id):
+            return None
+        
+        with _user_cache_lock:
+            data = _user_cache.get(user_id)
+        if data is None:
+            data = cls.collection.find_one(
+                {'_id': ObjectId(user_id)}, projection=cls.projection
+            )
+            if not data:
+                return None
+            with _user_cache_lock:
+                _user_cache[user_id] = data
+        
+        return cls(
+            name=data['name'],
+            email=data['email'],
+            password_hash=data['password_hash'],
+            _id=data['_id'],
+            created_at=data.get('created_at')
+        )
     
     @classmethod
     def create(cls, name: str, email: str, password: str) -> 'User':
         """Create a new user with hashed password."""
         password_hash = cls.hash_password(password)
         user = cls(name=name, email=email, password_hash=password_hash)
-        user.save()
+        user.insert()
         return user
@@ -3,13 +3,21 @@ Video Model
 """
 from datetime import datetime
 from bson import ObjectId
-from app.database import get_db
 
 
 class Video:
     """Video model for storing video metadata."""
     
     collection_name = 'videos'
+    collection = None  # Bound by database.register_collections
+    # Dashboard listing never needs youtube_id, so it is not fetched
+    list_projection = {
+        'title': 1,
+        'description': 1,
+        'thumbnail_url': 1,
+        'is_active': 1,
+        'created_at': 1
+    }
     
     def __init__(self, title, description, youtube_id, thumbnail_url, 
                  is_active=True, _id=None, created_at=None):
@@ -44,61 +52,69 @@ class Video:
             'description': self.description,
             'thumbnail_url': self.thumbnail_url,
             'is_active': self.is_active,
-            'created_at': self.created_at.isoformat() if self.created_at else None
+            'created_at': self.created_at  # Serialized to ISO-8601 by orjson
         }
     
     def save(self) -> 'Video':
         """Save video to database."""
-        db = get_db()
-        db[self.collection_name].update_one(
+        self.collection.update_one(
             {'_id': self._id},
             {'$set': self.to_dict()},
             upsert=True
         )
         return self
     
+    def insert(self) -> 'Video':
+        """Insert a new video into the database."""
+        self.collection.insert_one(self.to_dict())
+        return self
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Video':
+        """Build a video from a database document."""
+        return cls(
+            title=data['title'],
+            description=data['description'],
+            youtube_id=data.get('youtube_id'),
+            thumbnail_url=data['thumbnail_url'],
+            is_active=data.get('is_active', True),
+            _id=data['_id'],
+            created_at=data.get('created_at')
+        )
+    
     @classmethod
     def find_by_id(cls, video_id: str) -> 'Video':
         """Find video by ID."""
-        db = get_db()
-        try:
-            data = db[cls.collection_name].find_one({'_id': ObjectId(video_id)})
-            if data:
-                return cls(
-                    title=data['title'],
-                    description=data['description'],
-                    youtube_id=data['youtube_id'],
-                    thumbnail_url=data['thumbnail_url'],
-                    is_active=data.get('is_active', True),
-                    _id=data['_id'],
-                    created_at=data.get('created_at')
-                )
-        except Exception:
-            pass
-        return None
+        if not ObjectId.is_valid(video_id):
+            return None
+        
+        data = cls.collection.find_one({'_id': ObjectId(video_id)})
+        return cls.from_dict(data) if data else None
     
     @classmethod
     def get_active_videos(cls, limit: int = 2) -> list:
-        """Get active videos for dashboard."""
-        db = get_db()
-        videos = db[cls.collection_name].find(
-            {'is_active': True}
-        ).limit(limit)
-        
-        result = []
-        for data in videos:
-            video = cls(
-                title=data['title'],
-                description=data['description'],
-                youtube_id=data['youtube_id'],
-                thumbnail_url=data['thumbnail_url'],
-                is_active=data.get('is_active', True),
-                _id=data['_id'],
-                created_at=data.get('created_at')
-            )
-            result.append(video)
+        """
+        Get active videos for dashboard (youtube_id is not loaded).
         
-        return result
+        Runs as a single aggregation so any related data added later
+        (stats, owners, ...) can be joined with a $lookup stage in the
+        same round-trip instead of one query per video.
+        """
+        pipeline = [
+            {'$match': {'is_active': True}},
+            {'$sort': {'created_at': -1}},
+            {'$limit': limit},
+            {'$project': cls.list_projection}
+        ]
+        # One more than $limit so the server hits end-of-results within the
+        # first batch and closes the cursor itself (no getMore/killCursors)
+        videos = cls.collection.aggregate(
+            pipeline,
+            batchSize=limit + 1,
+            allowDiskUse=False,
+            hint='active_recent'
+        )
+        return [cls.from_dict(data) for data in videos]
     
     @classmethod
     def create(cls, title: str, description: str, youtube_id: str, 
@@ -111,5 +127,5 @@ class Video:
             thumbnail_url=thumbnail_url,
             is_active=is_active
         )
-        video.save()
+        video.insert()
         return video
@@ -1,19 +1,27 @@
 """
 Authentication Routes
 """
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, current_app, request, jsonify
 from flask_jwt_extended import (
     create_access_token, 
     jwt_required, 
     get_jwt_identity,
     get_jwt
 )
-from app.models.user import User
+from pymongo.errors import DuplicateKeyError
+from app.models.user import User, HashQueueFull
 from app.utils.validators import validate_email, validate_password
 
 auth_bp = Blueprint('auth', __name__)
 
 
+def _busy_response():
+    """503 response telling the client to retry after the password hashing queue drains."""
+    response = jsonify({'error': 'Server busy', 'message': 'Please try again shortly'})
+    response.headers['Retry-After'] = '1'
+    return response, 503
+
+
 @auth_bp.route('/signup', methods=['POST'])
 def signup():
     """
@@ -28,6 +36,7 @@ def signup():
         - 201: User created successfully with JWT token
         - 400: Validation error
         - 409: Email already exists
+        - 503: Server busy, retry later
     """
     try:
         data = request.get_json()
@@ -38,6 +47,7 @@ def signup():
         
         name = data.get('name', '').strip()
         email = data.get('email', '').strip()
+        email = email if email.islower() else email.lower()
         password = data.get('password', '')
         
         # Validation
@@ -50,14 +60,12 @@ def signup():
         if not password or not validate_password(password):
             return jsonify({'error': 'Password must be at least 6 characters'}), 400
         
-        # Check if email already exists
-        existing_user = User.find_by_email(email)
-        if existing_user:
+        # Create user (the unique email index rejects duplicates)
+        try:
+            user = User.create(name=name, email=email, password=password)
+        except DuplicateKeyError:
             return jsonify({'error': 'Email already registered'}), 409
         
-        # Create user
-        user = User.create(name=name, email=email, password=password)
-        
         # Generate JWT token
         access_token = create_access_token(identity=str(user._id))
         
@@ -67,8 +75,10 @@ def signup():
             'access_token': access_token
         }), 201
         
-    except Exception as e:
-        print(f"Signup error: {e}")
+    except HashQueueFull:
+        return _busy_response()
+    except Exception:
+        current_app.logger.exception('Signup failed')
         return jsonify({'error': 'Internal server error'}), 500
 
 
@@ -85,6 +95,7 @@ def login():
         - 200: Login successful with JWT token
         - 400: Validation error
         - 401: Invalid credentials
+        - 503: Server busy, retry later
     """
     try:
         data = request.get_json()
@@ -93,6 +104,7 @@ def login():
             return jsonify({'error': 'No data provided'}), 400
         
         email = data.get('email', '').strip()
+        email = email if email.islower() else email.lower()
         password = data.get('password', '')
         
         # Validation
@@ -111,6 +123,14 @@ def login():
         if not User.verify_password(password, user.password_hash):
             return jsonify({'error': 'Invalid email or password'}), 401
         
+        # Upgrade legacy bcrypt hashes or outdated Argon2 parameters. This is
+        # best-effort: a busy pool or failed write must not fail the login
+        if User.needs_rehash(user.password_hash):
+            try:
+                user.update_password_hash(User.hash_password(password))
+            except Exception:
+                current_app.logger.warning('Password rehash failed', exc_info=True)
+        
         # Generate JWT token
         access_token = create_access_token(identity=str(user._id))
         
@@ -120,8 +140,10 @@ def login():
             'access_token': access_token
         }), 200
         
-    except Exception as e:
-        print(f"Login error: {e}")
+    except HashQueueFull:
+        return _busy_response()
+    except Exception:
+        current_app.logger.exception('Login failed')
         return jsonify({'error': 'Internal server error'}), 500
 
 
@@ -150,8 +172,8 @@ def get_profile():
             'user': user.to_json()
         }), 200
         
-    except Exception as e:
-        print(f"Get profile error: {e}")
+    except Exception:
+        current_app.logger.exception('Get profile failed')
         return jsonify({'error': 'Internal server error'}), 500
 
 
@@ -177,6 +199,6 @@ def logout():
             'message': 'Logout successful'
         }), 200
         
-    except Exception as e:
-        print(f"Logout error: {e}")
+    except Exception:
+        current_app.logger.exception('Logout failed')
         return jsonify({'error': 'Internal server error'}), 500
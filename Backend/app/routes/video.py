@@ -3,98 +3,453 @@ Video Routes
 """
 from flask import Blueprint, request, jsonify, Response, make_response, stream_with_context
 from flask_jwt_extended import jwt_required, get_jwt_identity
+from markupsafe import escape
+from cachetools import LRUCache
+from app.cache import get_redis
 from app.models.video import Video
-from app.utils.video_token import generate_playback_token, verify_playback_token
+from app.utils.video_token import (
+    generate_playback_token,
+    verify_playback_token,
+    verify_playback_token_without_user
+)
+import logging
+import orjson
+import os
+import re
+import secrets
 import yt_dlp
 import threading
 import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 video_bp = Blueprint('video', __name__)
+logger = logging.getLogger(__name__)
 
-# Cache for extracted stream data (youtube_id -> {url, headers, expires_at})
+# Cache for extracted stream data (youtube_id -> {url, headers, expires_at}).
+# Reads are a single dict.get (atomic under the GIL) so concurrent proxy
+# requests never contend; the lock only serializes writers.
 _stream_cache = {}
 _cache_lock = threading.Lock()
 CACHE_DURATION = 3600  # 1 hour
 
+# Shared (Redis) cache keys, so all workers reuse one extraction
+SHARED_CACHE_KEY = 'ytstream:{}'
+SHARED_LOCK_KEY = 'ytstream:lock:{}'
+SHARED_LOCK_TIMEOUT = 30  # seconds
+SHARED_POLL_INTERVAL = 0.25  # seconds
+# Compare-and-delete: an expired lock re-taken by another worker is left alone
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+# Shared upstream session so range requests reuse pooled TCP/TLS connections
+_yt_session = requests.Session()
+_yt_session.mount('https://', HTTPAdapter(
+    pool_connections=50,
+    pool_maxsize=200,
+    max_retries=Retry(total=2, backoff_factor=0.1)
+))
+
+# Optional yt-dlp player clients (e.g. "android"), comma separated. Lighter
+# clients skip signature JS evaluation but YouTube changes them often, so
+# yt-dlp's own default stays in place unless configured.
+YTDLP_PLAYER_CLIENTS = [c for c in os.getenv('YTDLP_PLAYER_CLIENTS', '').split(',') if c]
+
+# Proxy read size: large enough to amortize per-chunk Python overhead,
+# small enough that the first bytes reach the player quickly
+PROXY_CHUNK_SIZE = 256 * 1024
+
+# Recently served 1 MiB blocks of upstream video, keyed by
+# (stream_url, block index). Sized in bytes, not entries.
+RANGE_BLOCK_SIZE = 1 << 20
+RANGE_CACHE_BYTES = 64 * RANGE_BLOCK_SIZE
+_range_cache = LRUCache(maxsize=RANGE_CACHE_BYTES, getsizeof=lambda entry: len(entry['data']))
+_range_cache_lock = threading.Lock()
+_BOUNDED_RANGE_RE = re.compile(r'bytes=(\d+)-(\d+)\Z')
+_CONTENT_RANGE_RE = re.compile(r'bytes (\d+)-\d+/(\d+|\*)\Z')
+
+# Cap on concurrent yt-dlp runs; same-video requests already coalesce below
+_EXTRACT_SEM = threading.BoundedSemaphore(min(8, (os.cpu_count() or 4) * 2))
+EXTRACT_QUEUE_TIMEOUT = 10  # seconds to wait for an extraction slot
+
+# In-flight extractions in this process (youtube_id -> {event, result, error})
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+
+class ExtractionBusy(Exception):
+    """Raised when no extraction slot frees up within EXTRACT_QUEUE_TIMEOUT."""
+
 
 def _get_cached_stream_data(youtube_id):
-    """Get cached stream data if still valid."""
-    with _cache_lock:
-        if youtube_id in _stream_cache:
-            cached = _stream_cache[youtube_id]
-            if cached['expires_at'] > time.time():
-                return cached
-            else:
-                del _stream_cache[youtube_id]
+    """Get cached stream data if still valid (expired entries count as a miss)."""
+    cached = _stream_cache.get(youtube_id)
+    if cached and cached['expires_at'] > time.monotonic():
+        return cached
     return None
 
 
-def _cache_stream_data(youtube_id, url, headers):
-    """Cache stream data."""
+def _cache_stream_data(youtube_id, url, headers, ttl=CACHE_DURATION):
+    """Cache stream data, pruning expired entries."""
+    now = time.monotonic()
     with _cache_lock:
+        for key in [k for k, v in _stream_cache.items() if v['expires_at'] <= now]:
+            del _stream_cache[key]
         _stream_cache[youtube_id] = {
             'url': url,
             'headers': headers,
-            'expires_at': time.time() + CACHE_DURATION
+            'expires_at': now + ttl
+        }
+
+
+def _get_shared_stream_data(youtube_id):
+    """Get stream data from Redis and copy it into the process cache."""
+    redis_client = get_redis()
+    if redis_client is None:
+        return None
+    
+    try:
+        raw = redis_client.get(SHARED_CACHE_KEY.format(youtube_id))
+    except Exception:
+        logger.warning("Redis read failed", exc_info=True)
+        return None
+    if not raw:
+        return None
+    
+    data = orjson.loads(raw)
+    ttl = data['expires_at'] - time.time()
+    if ttl <= 0:
+        return None
+    _cache_stream_data(youtube_id, data['url'], data['headers'], ttl)
+    return data
+
+
+def _share_stream_data(youtube_id, url, headers):
+    """Publish stream data to Redis for other workers."""
+    redis_client = get_redis()
+    if redis_client is None:
+        return
+    
+    payload = orjson.dumps({
+        'url': url,
+        'headers': headers,
+        'expires_at': time.time() + CACHE_DURATION
+    })
+    try:
+        redis_client.setex(SHARED_CACHE_KEY.format(youtube_id), CACHE_DURATION, payload)
+    except Exception:
+        logger.warning("Redis write failed", exc_info=True)
+
+
+def _acquire_shared_lock(youtube_id):
+    """
+    Try to become the one worker extracting this video.
+    
+    Returns (should_extract, lock_token). should_extract is False if another
+    worker holds the lock. lock_token is the value stored in Redis (None when
+    Redis is unavailable) and must be passed to _release_shared_lock.
+    """
+    redis_client = get_redis()
+    if redis_client is None:
+        return True, None
+    
+    token = secrets.token_hex(16).encode('ascii')
+    try:
+        acquired = redis_client.set(
+            SHARED_LOCK_KEY.format(youtube_id), token, nx=True, ex=SHARED_LOCK_TIMEOUT
+        )
+    except Exception:
+        logger.warning("Redis lock failed", exc_info=True)
+        return True, None
+    return (True, token) if acquired else (False, None)
+
+
+def _release_shared_lock(youtube_id, token):
+    """Release the extraction lock, but only if this worker still holds it."""
+    redis_client = get_redis()
+    if redis_client is None or token is None:
+        return
+    
+    try:
+        redis_client.eval(
+            _RELEASE_LOCK_SCRIPT, 1, SHARED_LOCK_KEY.format(youtube_id), token
+        )
+    except Exception:
+        logger.warning("Redis unlock failed", exc_info=True)
+
+
+def _wait_for_shared_stream_data(youtube_id):
+    """Poll Redis while another worker extracts; None if it never appears."""
+    deadline = time.monotonic() + SHARED_LOCK_TIMEOUT
+    while time.monotonic() < deadline:
+        shared = _get_shared_stream_data(youtube_id)
+        if shared:
+            return shared
+        time.sleep(SHARED_POLL_INTERVAL)
+    return None
+
+
+def _run_yt_dlp(youtube_id):
+    """
+    Run yt-dlp for a video.
+    Returns (url, headers), or (None, None) if no playable format was found.
+    """
+    youtube_url = f"https://www.youtube.com/watch?v={youtube_id}"
+    
+    ydl_opts = {
+        # Prefer progressive 720p H.264 mp4; fall back to any mp4, then anything
+        'format': (
+            'best[ext=mp4][height<=720][vcodec^=avc1]'
+            '/best[ext=mp4][height<=720]/best[ext=mp4]/best'
+        ),
+        'quiet': True,
+        'no_warnings': True,
+        'extract_flat': False,
+        'skip_download': True,
+        # Keep a stuck extraction from holding its slot (and its waiters)
+        'socket_timeout': 15,
+        # The proxy serves a single progressive URL, so don't fetch or
+        # parse the DASH/HLS manifests at all
+        'youtube_include_dash_manifest': False,
+        'youtube_include_hls_manifest': False,
+    }
+    if YTDLP_PLAYER_CLIENTS:
+        ydl_opts['extractor_args'] = {
+            'youtube': {
+                'player_client': YTDLP_PLAYER_CLIENTS,
+                'player_skip': ['webpage', 'configs']
+            }
         }
+    
+    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        info = ydl.extract_info(youtube_url, download=False)
+        
+        # Get the URL and headers
+        stream_url = info.get('url')
+        http_headers = info.get('http_headers', {})
+        
+        if stream_url:
+            return stream_url, http_headers
+        
+        # Try to get from formats
+        formats = info.get('formats', [])
+        for fmt in reversed(formats):
+            if fmt.get('url') and fmt.get('ext') == 'mp4':
+                return fmt['url'], fmt.get('http_headers', http_headers)
+        
+        # Fallback to any format
+        for fmt in reversed(formats):
+            if fmt.get('url'):
+                return fmt['url'], fmt.get('http_headers', http_headers)
+    
+    return None, None
+
+
+def _load_stream_data(youtube_id):
+    """
+    Load stream data on a process-cache miss: shared Redis cache first,
+    then yt-dlp. Returns (url, headers).
+    """
+    # A coalesced extraction may have just filled the process cache
+    cached = _get_cached_stream_data(youtube_id)
+    if cached:
+        return cached['url'], cached['headers']
+    
+    # Then the cache shared across workers
+    shared = _get_shared_stream_data(youtube_id)
+    if shared:
+        return shared['url'], shared['headers']
+    
+    # Bound concurrent extractions across different videos. The slot is
+    # taken before the Redis lock so the lock's TTL never runs out while
+    # this worker is still queued
+    if not _EXTRACT_SEM.acquire(timeout=EXTRACT_QUEUE_TIMEOUT):
+        raise ExtractionBusy()
+    
+    owns_lock = False
+    try:
+        # Another worker may have published the URL while this one queued
+        shared = _get_shared_stream_data(youtube_id)
+        if shared:
+            return shared['url'], shared['headers']
+        
+        # Another worker is already extracting: wait for its result
+        owns_lock, lock_token = _acquire_shared_lock(youtube_id)
+        if not owns_lock:
+            shared = _wait_for_shared_stream_data(youtube_id)
+            if shared:
+                return shared['url'], shared['headers']
+        else:
+            # ...or finished and released the lock just before we took it
+            shared = _get_shared_stream_data(youtube_id)
+            if shared:
+                return shared['url'], shared['headers']
+        
+        stream_url, http_headers = _run_yt_dlp(youtube_id)
+        if stream_url:
+            _cache_stream_data(youtube_id, stream_url, http_headers)
+            _share_stream_data(youtube_id, stream_url, http_headers)
+            logger.info("Extracted stream data for %s", youtube_id)
+        return stream_url, http_headers
+    finally:
+        if owns_lock:
+            _release_shared_lock(youtube_id, lock_token)
+        _EXTRACT_SEM.release()
+
+
+def _coalesced_load_stream_data(youtube_id):
+    """
+    Single-flight wrapper around _load_stream_data: the first caller for a
+    youtube_id does the work, concurrent callers wait for and share its result
+    (or its exception).
+    """
+    with _inflight_lock:
+        flight = _inflight.get(youtube_id)
+        is_leader = flight is None
+        if is_leader:
+            flight = _inflight[youtube_id] = {
+                'event': threading.Event(),
+                'result': (None, None),
+                'error': None
+            }
+    
+    if not is_leader:
+        # No timeout of our own: the leader's wait is already bounded by
+        # EXTRACT_QUEUE_TIMEOUT, the shared-lock wait and yt-dlp's timeouts,
+        # and it always sets the event on the way out
+        flight['event'].wait()
+        if flight['error'] is not None:
+            raise flight['error']
+        return flight['result']
+    
+    try:
+        flight['result'] = _load_stream_data(youtube_id)
+        return flight['result']
+    except Exception as e:
+        flight['error'] = e
+        raise
+    finally:
+        # Drop the entry before waking waiters so the dict never grows
+        with _inflight_lock:
+            _inflight.pop(youtube_id, None)
+        flight['event'].set()
 
 
 def _extract_stream_data(youtube_id):
     """
     Extract the direct stream URL and required headers from YouTube using yt-dlp.
     Returns both URL and headers needed to access the stream.
+    
+    Lookup order: process cache, shared Redis cache, then yt-dlp, with
+    concurrent misses for the same video coalesced into one load.
     """
     try:
-        # Check cache first
+        # Check process cache first
         cached = _get_cached_stream_data(youtube_id)
         if cached:
-            print(f"Using cached stream data for {youtube_id}")
+            logger.debug("Using cached stream data for %s", youtube_id)
             return cached['url'], cached['headers']
-
-        youtube_url = f"https://www.youtube.com/watch?v={youtube_id}"
         
-        ydl_opts = {
-            'format': 'best[ext=mp4][height<=720]/best[ext=mp4]/best',  # Prefer 720p mp4
-            'quiet': True,
-            'no_warnings': True,
-            'extract_flat': False,
-        }
+        return _coalesced_load_stream_data(youtube_id)
         
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(youtube_url, download=False)
-            
-            # Get the URL and headers
-            stream_url = info.get('url')
-            http_headers = info.get('http_headers', {})
-            
-            if stream_url:
-                _cache_stream_data(youtube_id, stream_url, http_headers)
-                print(f"Extracted stream data for {youtube_id}")
-                return stream_url, http_headers
-            
-            # Try to get from formats
-            formats = info.get('formats', [])
-            for fmt in reversed(formats):
-                if fmt.get('url') and fmt.get('ext') == 'mp4':
-                    url = fmt['url']
-                    headers = fmt.get('http_headers', http_headers)
-                    _cache_stream_data(youtube_id, url, headers)
-                    return url, headers
-            
-            # Fallback to any format
-            for fmt in reversed(formats):
-                if fmt.get('url'):
-                    url = fmt['url']
-                    headers = fmt.get('http_headers', http_headers)
-                    _cache_stream_data(youtube_id, url, headers)
-                    return url, headers
-                    
+    except ExtractionBusy:
+        raise
+    except Exception:
+        logger.exception("Error extracting stream data")
         return None, None
+
+
+def _parse_bounded_range(range_header):
+    """
+    Parse a closed 'bytes=start-end' range that fits inside one cache block.
+    Returns (start, end), or None for open-ended/multi-block/invalid ranges.
+    """
+    match = _BOUNDED_RANGE_RE.match(range_header or '')
+    if not match:
+        return None
+    
+    start, end = int(match.group(1)), int(match.group(2))
+    if end < start or start // RANGE_BLOCK_SIZE != end // RANGE_BLOCK_SIZE:
+        return None
+    return start, end
+
+
+def _get_range_block(stream_url, stream_headers, block):
+    """Get a 1 MiB-aligned block of the upstream stream, from cache or YouTube."""
+    key = (stream_url, block)
+    with _range_cache_lock:
+        entry = _range_cache.get(key)
+    if entry:
+        return entry
+    
+    block_start = block * RANGE_BLOCK_SIZE
+    req_headers = dict(stream_headers) if stream_headers else {}
+    req_headers['Range'] = f"bytes={block_start}-{block_start + RANGE_BLOCK_SIZE - 1}"
+    
+    # Stream so a miss (full 200 body, wrong range) is closed unread
+    resp = _yt_session.get(stream_url, headers=req_headers, stream=True, timeout=30)
+    try:
+        content_range = _CONTENT_RANGE_RE.match(resp.headers.get('Content-Range', ''))
+        if (resp.status_code != 206 or not content_range
+                or int(content_range.group(1)) != block_start):
+            return None
         
-    except Exception as e:
-        print(f"Error extracting stream data: {e}")
-        return None, None
+        entry = {
+            'data': resp.content,
+            'total': content_range.group(2),
+            'content_type': resp.headers.get('Content-Type', 'video/mp4')
+        }
+    finally:
+        resp.close()
+    
+    with _range_cache_lock:
+        _range_cache[key] = entry
+    return entry
+
+
+def _known_content_length(youtube_id):
+    """
+    Total stream size from an already-cached range block, without touching
+    yt-dlp or YouTube. Returns None if it isn't known yet.
+    """
+    cached = _get_cached_stream_data(youtube_id)
+    if not cached:
+        return None
+    
+    with _range_cache_lock:
+        entry = _range_cache.get((cached['url'], 0))
+    if not entry or entry['total'] == '*':
+        return None
+    return entry['total']
+
+
+def _cached_range_response(stream_url, stream_headers, start, end):
+    """
+    Serve a small bounded range (seek probes, metadata reads) from the block
+    cache. Returns None if the range can't be served this way.
+    """
+    block = start // RANGE_BLOCK_SIZE
+    entry = _get_range_block(stream_url, stream_headers, block)
+    if not entry:
+        return None
+    
+    offset = start - block * RANGE_BLOCK_SIZE
+    body = entry['data'][offset:offset + end - start + 1]
+    if not body:
+        return None
+    
+    return Response(body, status=206, headers={
+        'Content-Type': entry['content_type'],
+        'Accept-Ranges': 'bytes',
+        'Access-Control-Allow-Origin': '*',
+        'Content-Length': str(len(body)),
+        'Content-Range': f"bytes {start}-{start + len(body) - 1}/{entry['total']}"
+    })
 
 
 @video_bp.route('/dashboard', methods=['GET'])
@@ -122,8 +477,8 @@ def get_dashboard():
             'count': len(videos_json)
         }), 200
         
-    except Exception as e:
-        print(f"Dashboard error: {e}")
+    except Exception:
+        logger.exception("Dashboard error")
         return jsonify({'error': 'Internal server error'}), 500
 
 
@@ -169,8 +524,8 @@ def get_video_details(video_id):
             'player_url': player_url  # App loads this in WebView
         }), 200
         
-    except Exception as e:
-        print(f"Get video error: {e}")
+    except Exception:
+        logger.exception("Get video error")
         return jsonify({'error': 'Internal server error'}), 500
 
 
@@ -237,12 +592,12 @@ def stream_video(video_id):
             'expires_in': 3600  # Token valid for 1 hour
         }), 200
         
-    except Exception as e:
-        print(f"Stream video error: {e}")
+    except Exception:
+        logger.exception("Stream video error")
         return jsonify({'error': 'Internal server error'}), 500
 
 
-@video_bp.route('/video/<video_id>/proxy', methods=['GET'])
+@video_bp.route('/video/<video_id>/proxy', methods=['GET', 'HEAD'])
 def proxy_video(video_id):
     """
     Proxy the video stream through our backend.
@@ -254,10 +609,12 @@ def proxy_video(video_id):
         - token: string (playback token, required)
     
     Returns:
-        - 200: Video stream
+        - 200: Video stream (headers only for HEAD)
+        - 206: Partial video stream for Range requests
         - 400: Missing or invalid token
         - 404: Video not found
         - 500: Failed to stream
+        - 503: Too many concurrent extractions, retry later
     """
     try:
         # Get and validate playback token
@@ -281,6 +638,22 @@ def proxy_video(video_id):
         if not video.is_active:
             return "Video not available", 404
         
+        # HEAD probes only need to know the stream exists and supports
+        # ranges, so skip extraction and the upstream fetch entirely
+        if request.method == 'HEAD':
+            response = Response(status=200, headers={
+                'Content-Type': 'video/mp4',
+                'Accept-Ranges': 'bytes',
+                'Access-Control-Allow-Origin': '*',
+            })
+            total = _known_content_length(video.youtube_id)
+            if total:
+                response.headers['Content-Length'] = total
+            else:
+                # Don't advertise an empty body when the size is unknown
+                response.automatically_set_content_length = False
+            return response
+        
         # Extract stream URL and headers
         stream_url, stream_headers = _extract_stream_data(video.youtube_id)
         
@@ -289,13 +662,23 @@ def proxy_video(video_id):
         
         # Handle range requests for seeking
         range_header = request.headers.get('Range')
+        
+        # Small bounded ranges are served from the block cache
+        bounded_range = _parse_bounded_range(range_header)
+        if bounded_range:
+            cached_response = _cached_range_response(
+                stream_url, stream_headers, *bounded_range
+            )
+            if cached_response is not None:
+                return cached_response
+        
         req_headers = dict(stream_headers) if stream_headers else {}
         
         if range_header:
             req_headers['Range'] = range_header
         
         # Fetch video from YouTube
-        resp = requests.get(stream_url, headers=req_headers, stream=True, timeout=30)
+        resp = _yt_session.get(stream_url, headers=req_headers, stream=True, timeout=30)
         
         # Build response headers
         response_headers = {
@@ -311,9 +694,15 @@ def proxy_video(video_id):
         
         # Stream the video
         def generate():
-            for chunk in resp.iter_content(chunk_size=8192):
-                if chunk:
-                    yield chunk
+            try:
+                for chunk in resp.iter_content(chunk_size=PROXY_CHUNK_SIZE):
+                    if chunk:
+                        yield chunk
+            finally:
+                # Runs on completion and when the client disconnects (the
+                # WSGI server closes the generator), so the upstream download
+                # stops and the connection is released
+                resp.close()
         
         status_code = 206 if range_header and resp.status_code == 206 else 200
         
@@ -323,92 +712,67 @@ def proxy_video(video_id):
             headers=response_headers
         )
         
+    except ExtractionBusy:
+        logger.warning("Video proxy busy: no extraction slot for %s", video_id)
+        return "Server busy", 503, {'Retry-After': '5'}
     except requests.exceptions.Timeout:
-        print("Video proxy timeout")
+        logger.warning("Video proxy timeout")
         return "Stream timeout", 504
-    except Exception as e:
-        print(f"Video proxy error: {e}")
+    except Exception:
+        logger.exception("Video proxy error")
         return "Failed to stream video", 500
 
 
-@video_bp.route('/video/<video_id>/player', methods=['GET'])
-def video_player(video_id):
+def _minify_html(html: str) -> str:
     """
-    Serve the video player HTML page.
-    
-    This endpoint serves an HTML page with embedded video player.
-    The YouTube URL is embedded in the HTML, NOT in JSON responses.
-    This way, the mobile app never sees the raw YouTube URL.
-    
-    The app loads this URL in a WebView.
-    
-    Query Parameters:
-        - token: string (playback token, required)
-    
-    Returns:
-        - 200: HTML page with embedded video
-        - 400: Missing or invalid token
-        - 404: Video not found
+    Strip comments, indentation and blank lines from the static player markup.
+    Line breaks are kept so the inline JS never depends on semicolon insertion.
     """
-    try:
-        # Get playback token from query
-        playback_token = request.args.get('token')
-        
-        if not playback_token:
-            return _error_html("Playback token is required"), 400
-        
-        # Verify the playback token (extract user_id from token itself)
-        token_data = verify_playback_token_without_user(playback_token, video_id)
-        
-        if not token_data:
-            return _error_html("Invalid or expired playback token"), 400
-        
-        # Get video from database
-        video = Video.find_by_id(video_id)
-        
-        if not video:
-            return _error_html("Video not found"), 404
-        
-        if not video.is_active:
-            return _error_html("Video is not available"), 404
-        
-        # Generate the HTML player page with YouTube completely hidden
-        # Uses YouTube IFrame API for custom controls
-        # The YouTube URL is ONLY here - never in JSON responses!
-        html_content = f"""
+    html = re.sub(r'<!--.*?-->', '', html, flags=re.S)
+    html = re.sub(r'/\*.*?\*/', '', html, flags=re.S)
+    lines = (line.strip() for line in html.splitlines())
+    return '\n'.join(line for line in lines if line and not line.startswith('//'))
+
+
+# Player page, split around the two per-request values (title, youtube_id),
+# minified and encoded once at import so each request only joins five
+# byte strings. The YouTube URL is ONLY here - never in JSON responses!
+_PLAYER_HTML_HEAD = _minify_html("""
 <!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0, maximum-scale=1.0, user-scalable=no">
-    <title>{video.title}</title>
+    <title>""").encode('utf-8')
+
+_PLAYER_HTML_MID = _minify_html("""</title>
     <style>
-        * {{
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
-        html, body {{
+        }
+        html, body {
             width: 100%;
             height: 100%;
             background-color: #000;
             overflow: hidden;
             touch-action: manipulation;
-        }}
-        .player-wrapper {{
+        }
+        .player-wrapper {
             position: relative;
             width: 100%;
             height: 100%;
-        }}
-        #player {{
+        }
+        #player {
             position: absolute;
             top: 0;
             left: 0;
             width: 100%;
             height: 100%;
-        }}
+        }
         /* Custom controls overlay */
-        .controls {{
+        .controls {
             position: absolute;
             bottom: 0;
             left: 0;
@@ -419,8 +783,8 @@ def video_player(video_id):
             display: flex;
             align-items: center;
             gap: 15px;
-        }}
-        .play-btn {{
+        }
+        .play-btn {
             width: 44px;
             height: 44px;
             background: rgba(255,255,255,0.2);
@@ -432,29 +796,29 @@ def video_player(video_id):
             display: flex;
             align-items: center;
             justify-content: center;
-        }}
-        .progress-container {{
+        }
+        .progress-container {
             flex: 1;
             height: 6px;
             background: rgba(255,255,255,0.3);
             border-radius: 3px;
             cursor: pointer;
-        }}
-        .progress-bar {{
+        }
+        .progress-bar {
             height: 100%;
             background: #ff0000;
             border-radius: 3px;
             width: 0%;
             transition: width 0.1s;
-        }}
-        .time {{
+        }
+        .time {
             color: white;
             font-size: 12px;
             font-family: Arial, sans-serif;
             min-width: 80px;
             text-align: right;
-        }}
-        .mute-btn {{
+        }
+        .mute-btn {
             width: 40px;
             height: 40px;
             background: transparent;
@@ -462,18 +826,18 @@ def video_player(video_id):
             color: white;
             font-size: 20px;
             cursor: pointer;
-        }}
+        }
         /* Tap area for play/pause */
-        .tap-area {{
+        .tap-area {
             position: absolute;
             top: 0;
             left: 0;
             right: 0;
             bottom: 60px;
             z-index: 50;
-        }}
+        }
         /* Center play button */
-        .center-play {{
+        .center-play {
             position: absolute;
             top: 50%;
             left: 50%;
@@ -491,10 +855,10 @@ def video_player(video_id):
             opacity: 0;
             transition: opacity 0.2s;
             pointer-events: none;
-        }}
-        .center-play.visible {{
+        }
+        .center-play.visible {
             opacity: 1;
-        }}
+        }
     </style>
 </head>
 <body>
@@ -530,10 +894,12 @@ def video_player(video_id):
         var isMuted = false;
         var updateInterval;
 
-        function onYouTubeIframeAPIReady() {{
-            player = new YT.Player('player', {{
-                videoId: '{video.youtube_id}',
-                playerVars: {{
+        function onYouTubeIframeAPIReady() {
+            player = new YT.Player('player', {
+                videoId: '""").encode('utf-8')
+
+_PLAYER_HTML_TAIL = _minify_html("""',
+                playerVars: {
                     'autoplay': 1,
                     'controls': 0,
                     'rel': 0,
@@ -543,81 +909,81 @@ def video_player(video_id):
                     'iv_load_policy': 3,
                     'disablekb': 1,
                     'origin': window.location.origin
-                }},
-                events: {{
+                },
+                events: {
                     'onReady': onPlayerReady,
                     'onStateChange': onPlayerStateChange
-                }}
-            }});
-        }}
+                }
+            });
+        }
 
-        function onPlayerReady(event) {{
+        function onPlayerReady(event) {
             event.target.playVideo();
             startProgressUpdate();
-        }}
+        }
 
-        function onPlayerStateChange(event) {{
+        function onPlayerStateChange(event) {
             isPlaying = (event.data === YT.PlayerState.PLAYING);
             updatePlayButton();
-        }}
+        }
 
-        function updatePlayButton() {{
+        function updatePlayButton() {
             document.getElementById('playBtn').textContent = isPlaying ? '⏸' : '▶';
             document.getElementById('centerPlay').textContent = isPlaying ? '⏸' : '▶';
-        }}
+        }
 
-        function togglePlay() {{
-            if (isPlaying) {{
+        function togglePlay() {
+            if (isPlaying) {
                 player.pauseVideo();
-            }} else {{
+            } else {
                 player.playVideo();
-            }}
+            }
             // Show center indicator briefly
             var center = document.getElementById('centerPlay');
             center.classList.add('visible');
-            setTimeout(function() {{
+            setTimeout(function() {
                 center.classList.remove('visible');
-            }}, 500);
-        }}
+            }, 500);
+        }
 
-        function toggleMute() {{
-            if (isMuted) {{
+        function toggleMute() {
+            if (isMuted) {
                 player.unMute();
                 isMuted = false;
                 document.getElementById('muteBtn').textContent = '🔊';
-            }} else {{
+            } else {
                 player.mute();
                 isMuted = true;
                 document.getElementById('muteBtn').textContent = '🔇';
-            }}
-        }}
+            }
+        }
 
-        function formatTime(seconds) {{
+        function formatTime(seconds) {
             var mins = Math.floor(seconds / 60);
             var secs = Math.floor(seconds % 60);
             return mins + ':' + (secs < 10 ? '0' : '') + secs;
-        }}
+        }
 
-        function startProgressUpdate() {{
-            updateInterval = setInterval(function() {{
-                if (player && player.getCurrentTime) {{
+        function startProgressUpdate() {
+            updateInterval = setInterval(function() {
+                if (player && player.getCurrentTime) {
                     var current = player.getCurrentTime();
                     var duration = player.getDuration();
                     var percent = (current / duration) * 100;
                     document.getElementById('progressBar').style.width = percent + '%';
                     document.getElementById('timeDisplay').textContent = 
                         formatTime(current) + ' / ' + formatTime(duration);
-                }}
-            }}, 250);
-        }}
+                }
+            }, 250);
+        }
 
-        function seek(e) {{
+        function seek(e) {
             var container = document.getElementById('progressContainer');
             var rect = container.getBoundingClientRect();
             var percent = (e.clientX - rect.left) / rect.width;
             var duration = player.getDuration();
             player.seekTo(percent * duration, true);
-        }}
+        }
 
         // Event listeners
         document.getElementById('playBtn').addEventListener('click', togglePlay);
@@ -626,19 +992,72 @@ def video_player(video_id):
         document.getElementById('progressContainer').addEventListener('click', seek);
 
         // Block any navigation attempts
-        window.open = function() {{ return null; }};
+        window.open = function() { return null; };
     </script>
 </body>
 </html>
-"""
+""").encode('utf-8')
+
+
+@video_bp.route('/video/<video_id>/player', methods=['GET'])
+def video_player(video_id):
+    """
+    Serve the video player HTML page.
+    
+    This endpoint serves an HTML page with embedded video player.
+    The YouTube URL is embedded in the HTML, NOT in JSON responses.
+    This way, the mobile app never sees the raw YouTube URL.
+    
+    The app loads this URL in a WebView.
+    
+    Query Parameters:
+        - token: string (playback token, required)
+    
+    Returns:
+        - 200: HTML page with embedded video
+        - 400: Missing or invalid token
+        - 404: Video not found
+    """
+    try:
+        # Get playback token from query
+        playback_token = request.args.get('token')
+        
+        if not playback_token:
+            return _error_html("Playback token is required"), 400
+        
+        # Verify the playback token (extract user_id from token itself)
+        token_data = verify_playback_token_without_user(playback_token, video_id)
+        
+        if not token_data:
+            return _error_html("Invalid or expired playback token"), 400
+        
+        # Get video from database
+        video = Video.find_by_id(video_id)
+        
+        if not video:
+            return _error_html("Video not found"), 404
+        
+        if not video.is_active:
+            return _error_html("Video is not available"), 404
+        
+        # Generate the HTML player page with YouTube completely hidden
+        # Uses YouTube IFrame API for custom controls
+        # Title is escaped: it is admin-supplied text rendered into HTML
+        html_content = b"".join([
+            _PLAYER_HTML_HEAD,
+            str(escape(video.title)).encode('utf-8'),
+            _PLAYER_HTML_MID,
+            video.youtube_id.encode('utf-8'),
+            _PLAYER_HTML_TAIL
+        ])
         response = make_response(html_content)
-        response.headers['Content-Type'] = 'text/html'
+        response.headers['Content-Type'] = 'text/html; charset=utf-8'
         response.headers['Cache-Control'] = 'no-store, no-cache, must-revalidate, max-age=0'
         response.headers['Pragma'] = 'no-cache'
         return response
         
-    except Exception as e:
-        print(f"Video player error: {e}")
+    except Exception:
+        logger.exception("Video player error")
         return _error_html("Internal server error"), 500
 
 
@@ -685,32 +1104,3 @@ def _error_html(message: str) -> Response:
     response.headers['Content-Type'] = 'text/html'
     return response
 
-
-def verify_playback_token_without_user(token: str, video_id: str) -> dict:
-    """
-    Verify playback token without requiring user_id.
-    Used for the HTML player endpoint which doesn't have JWT auth.
-    """
-    import jwt
-    import os
-    
-    try:
-        secret = os.getenv('JWT_SECRET_KEY', 'jwt-secret-key') + '-video'
-        payload = jwt.decode(token, secret, algorithms=['HS256'])
-        
-        # Verify token type
-        if payload.get('type') != 'playback':
-            return None
-        
-        # Verify video ID matches
-        if payload.get('video_id') != video_id:
-            return None
-        
-        return payload
-        
-    except jwt.ExpiredSignatureError:
-        print("Playback token expired")
-        return None
-    except jwt.InvalidTokenError as e:
-        print(f"Invalid playback token: {e}")
-        return None
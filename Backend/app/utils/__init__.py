@@ -2,11 +2,18 @@
 Utilities Package
 """
 from app.utils.validators import validate_email, validate_password
-from app.utils.video_token import generate_playback_token, verify_playback_token
+from app.utils.video_token import (
+    generate_playback_token,
+    verify_playback_token,
+    verify_playback_token_without_user
+)
+from app.utils.json_provider import ORJSONProvider
 
 __all__ = [
     'validate_email', 
     'validate_password',
     'generate_playback_token',
-    'verify_playback_token'
+    'verify_playback_token',
+    'verify_playback_token_without_user',
+    'ORJSONProvider'
 ]
@@ -0,0 +1,37 @@
+"""
+orjson-backed JSON Provider
+
+Replaces Flask's stdlib-json provider so jsonify() and request.get_json()
+go through orjson, which serializes datetimes natively in C.
+"""
+from bson import ObjectId
+from flask.json.provider import JSONProvider
+import orjson
+
+
+def _default(obj):
+    """Serialize types orjson doesn't know about."""
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class ORJSONProvider(JSONProvider):
+    """Flask JSON provider using orjson."""
+
+    mimetype = 'application/json'
+    option = orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj, **kwargs) -> str:
+        """Serialize data as a JSON string."""
+        return orjson.dumps(obj, default=_default, option=self.option).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        """Deserialize data from a JSON string or bytes."""
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        """Build a JSON response straight from orjson's bytes output."""
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=_default, option=self.option)
+        return self._app.response_class(body, mimetype=self.mimetype)
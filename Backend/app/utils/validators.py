@@ -3,6 +3,12 @@ Validation Utilities
 """
 import re
 
+# Compiled once at import instead of on every request. \Z (not $) so a
+# trailing newline can't slip through.
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\Z')
+# RFC 5321 limit; also bounds regex backtracking on hostile input
+MAX_EMAIL_LENGTH = 254
+
 
 def validate_email(email: str) -> bool:
     """
@@ -14,12 +20,10 @@ def validate_email(email: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    if not email:
+    if not email or len(email) > MAX_EMAIL_LENGTH:
         return False
     
-    # Simple email regex pattern
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    return _EMAIL_RE.match(email) is not None
 
 
 def validate_password(password: str, min_length: int = 6) -> bool:
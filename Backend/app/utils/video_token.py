@@ -9,14 +9,40 @@ Flow:
 2. Client requests stream with token → Backend validates and returns embed URL
 3. Token expires after 1 hour → Client must request new token
 """
+from functools import lru_cache
 import jwt
+import logging
 import os
+import time
 from datetime import datetime, timedelta
 
+logger = logging.getLogger(__name__)
+
+# Built once at import (load_dotenv has already run in the app package)
+_VIDEO_SECRET = os.getenv('JWT_SECRET_KEY', 'video-secret-key') + '-video'
+
 
 def get_video_secret() -> str:
     """Get the secret key for video tokens."""
-    return os.getenv('JWT_SECRET_KEY', 'video-secret-key') + '-video'
+    return _VIDEO_SECRET
+
+
+@lru_cache(maxsize=4096)
+def _decode_token_cached(token: str) -> tuple:
+    """
+    Verify a token's signature and return its claims as a tuple of items.
+    
+    Every seek in the player re-sends the same token to /proxy, so the
+    signature check is cached. Expiry is deliberately NOT checked here
+    (the result would be cached past exp); callers check it on every use.
+    """
+    payload = jwt.decode(
+        token,
+        get_video_secret(),
+        algorithms=['HS256'],
+        options={'verify_exp': False}
+    )
+    return tuple(payload.items())
 
 
 def generate_playback_token(video_id: str, user_id: str) -> str:
@@ -47,6 +73,36 @@ def generate_playback_token(video_id: str, user_id: str) -> str:
     return token
 
 
+def _decode_playback_payload(token: str, video_id: str) -> dict:
+    """
+    Decode a playback token and check expiry, type and video binding.
+    
+    Returns:
+        Decoded token payload if valid, None otherwise
+    """
+    try:
+        payload = dict(_decode_token_cached(token))
+    except jwt.InvalidTokenError as e:
+        logger.info("Invalid playback token: %s", e)
+        return None
+    
+    # Verify expiry (not covered by the decode cache)
+    exp = payload.get('exp')
+    if not isinstance(exp, (int, float)) or exp <= time.time():
+        logger.info("Playback token expired")
+        return None
+    
+    # Verify token type
+    if payload.get('type') != 'playback':
+        return None
+    
+    # Verify video ID matches
+    if payload.get('video_id') != video_id:
+        return None
+    
+    return payload
+
+
 def verify_playback_token(token: str, video_id: str, user_id: str) -> dict:
     """
     Verify a playback token.
@@ -64,26 +120,25 @@ def verify_playback_token(token: str, video_id: str, user_id: str) -> dict:
     Returns:
         Decoded token payload if valid, None otherwise
     """
-    try:
-        payload = jwt.decode(token, get_video_secret(), algorithms=['HS256'])
-        
-        # Verify token type
-        if payload.get('type') != 'playback':
-            return None
-        
-        # Verify video ID matches
-        if payload.get('video_id') != video_id:
-            return None
-        
-        # Verify user ID matches
-        if payload.get('user_id') != user_id:
-            return None
-        
-        return payload
-        
-    except jwt.ExpiredSignatureError:
-        print("Playback token expired")
-        return None
-    except jwt.InvalidTokenError as e:
-        print(f"Invalid playback token: {e}")
+    payload = _decode_playback_payload(token, video_id)
+    
+    # Verify user ID matches
+    if payload is None or payload.get('user_id') != user_id:
         return None
+    
+    return payload
+
+
+def verify_playback_token_without_user(token: str, video_id: str) -> dict:
+    """
+    Verify playback token without requiring user_id.
+    Used for the HTML player and proxy endpoints which don't have JWT auth.
+    
+    Args:
+        token: The playback token to verify
+        video_id: Expected video ID
+    
+    Returns:
+        Decoded token payload if valid, None otherwise
+    """
+    return _decode_playback_payload(token, video_id)
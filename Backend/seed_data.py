@@ -4,9 +4,9 @@ Database Seed Script
 Run this script to populate the database with sample videos.
 Usage: python seed_data.py
 """
+from pymongo import UpdateOne
 from app import create_app
 from app.models.video import Video
-from app.database import get_db
 
 
 def seed_videos():
@@ -31,24 +31,26 @@ def seed_videos():
         }
     ]
     
-    db = get_db()
+    videos = Video.collection
     
     # Clear existing videos (optional)
-    # db.videos.delete_many({})
+    # videos.delete_many({})
     
-    for video_data in sample_videos:
-        # Check if video already exists
-        existing = db.videos.find_one({'youtube_id': video_data['youtube_id']})
-        
-        if not existing:
-            video = Video.create(
-                title=video_data['title'],
-                description=video_data['description'],
-                youtube_id=video_data['youtube_id'],
-                thumbnail_url=video_data['thumbnail_url'],
-                is_active=video_data['is_active']
-            )
-            print(f"[OK] Created video: {video.title}")
+    # Insert missing videos in one unordered bulk write; existing ones
+    # (matched by youtube_id) are left untouched by $setOnInsert
+    ops = [
+        UpdateOne(
+            {'youtube_id': video_data['youtube_id']},
+            {'$setOnInsert': Video(**video_data).to_dict()},
+            upsert=True
+        )
+        for video_data in sample_videos
+    ]
+    result = videos.bulk_write(ops, ordered=False)
+    
+    for index, video_data in enumerate(sample_videos):
+        if index in result.upserted_ids:
+            print(f"[OK] Created video: {video_data['title']}")
         else:
             print(f"[SKIP] Video already exists: {video_data['title']}")
     